@@ -25,16 +25,24 @@ Usage:
 
 import argparse
 import json
-import os
+import mmap
 from collections import Counter, defaultdict
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # orjson parses JSONL lines several times faster than stdlib json; it is
+    # optional, so fall back transparently when it is not installed.
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
 
 def majority_vote(
-    preds: List[str], first_seen_order: Dict[str, int]
-) -> Tuple[str, Dict[str, int]]:
+    counter: Counter, first_seen_order: Dict[str, int]
+) -> Tuple[str, Optional[Dict[str, int]]]:
     """
-    Compute the majority-vote prediction for a list of candidate predictions.
+    Compute the majority-vote prediction from a Counter of candidate predictions.
 
     Tie-breaking rules (deterministic):
       1) Highest frequency wins.
@@ -44,9 +52,9 @@ def majority_vote(
          fall back to lexicographic order.
 
     Returns:
-      (chosen_prediction, counts_dict)
+      (chosen_prediction, counts_dict); counts_dict is None for unanimous
+      votes, where it would carry no information beyond the prediction itself.
     """
-    counter = Counter(preds)
     # Get the max vote count
     max_count = max(counter.values())
     # All candidates that share the max vote count
@@ -59,27 +67,27 @@ def majority_vote(
         tied.sort(key=lambda x: (first_seen_order.get(x, float("inf")), x))
         chosen = tied[0]
 
-    # Expose counts for optional debugging/inspection
+    # Expose counts for optional debugging/inspection; skip the allocation
+    # entirely when the vote was unanimous
+    if len(counter) == 1:
+        return chosen, None
     return chosen, dict(counter)
 
 
-def discover_runs(results_dir: str) -> List[str]:
+def discover_runs(results_dir: Path) -> List[Path]:
     """
     Discover subdirectories inside results_dir that potentially contain a
     'benchmark_results.jsonl'. We don't strictly require the subdir name to
     start with 'run_', but we sort the list to keep processing deterministic.
     """
     runs = []
-    for name in sorted(os.listdir(results_dir)):
-        path = os.path.join(results_dir, name)
-        if os.path.isdir(path):
-            fpath = os.path.join(path, "benchmark_results.jsonl")
-            if os.path.isfile(fpath):
-                runs.append(path)
+    for path in sorted(results_dir.iterdir()):
+        if path.is_dir() and (path / "benchmark_results.jsonl").is_file():
+            runs.append(path)
     return runs
 
 
-def extract_predictions_from_file(file_path: str) -> Dict[str, str]:
+def extract_predictions_from_file(file_path: Path) -> Dict[str, str]:
     """
     Extract predictions from a single benchmark_results.jsonl file.
 
@@ -88,55 +96,82 @@ def extract_predictions_from_file(file_path: str) -> Dict[str, str]:
 
     Returns:
         Dictionary mapping task_id to prediction
+
+    The inner loop is the hot path for large result files, so it is kept
+    minimal: the file is memory-mapped and split on newlines with mmap.find
+    (memchr under the hood), with local name bindings and orjson when
+    available.
     """
-    predictions = {}
-
-    with open(file_path, "r", encoding="utf-8") as fin:
-        for line_num, line in enumerate(fin, 1):
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                rec = json.loads(line)
-            except json.JSONDecodeError as e:
-                print(
-                    f"Warning: Skipping malformed JSON at line {line_num} in {file_path}: {e}"
-                )
-                continue
-
-            task_id = rec.get("task_id")
-            pred = rec.get("model_boxed_answer")
-
-            # Only accept non-empty strings; coerce to str for safety
-            if task_id and pred is not None and str(pred).strip():
-                pred_str = str(pred).strip()
-                predictions[task_id] = pred_str
+    predictions: Dict[str, str] = {}
+    loads = _loads
+
+    with open(file_path, "rb") as fin:
+        try:
+            mm = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; nothing to extract anyway
+            return predictions
+
+        with mm:
+            size = len(mm)
+            start = 0
+            line_num = 0
+            while start < size:
+                nl = mm.find(b"\n", start)
+                if nl < 0:
+                    nl = size
+                line = mm[start:nl].strip()
+                start = nl + 1
+                line_num += 1
+                if not line:
+                    continue
+
+                try:
+                    rec = loads(line)
+                except ValueError as e:
+                    print(
+                        f"Warning: Skipping malformed JSON at line {line_num} in {file_path}: {e}"
+                    )
+                    continue
+
+                task_id = rec.get("task_id")
+                pred = rec.get("model_boxed_answer")
+
+                # Only accept non-empty strings; coerce to str for safety
+                if task_id and pred is not None:
+                    pred_str = str(pred).strip()
+                    if pred_str:
+                        predictions[task_id] = pred_str
 
     return predictions
 
 
 def aggregate_multiple_runs(
-    results_dir: str,
-) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+    results_dir: Path,
+    runs: List[Path] = None,
+) -> Tuple[Dict[str, Counter], Dict[str, int]]:
     """
     Aggregate predictions from multiple runs in subdirectories.
 
     Args:
         results_dir: Directory containing run_* subdirectories
+        runs: Pre-discovered run directories; discovered from results_dir if None
 
     Returns:
-        Tuple of (predictions_by_task, first_seen_order)
+        Tuple of (predictions_by_task, first_seen_order); predictions are
+        stored as per-task Counters so duplicate strings across runs are
+        deduplicated and majority voting needs no extra pass
     """
-    # Maps task_id -> list of predictions collected across runs
-    preds_by_task: Dict[str, List[str]] = defaultdict(list)
+    # Maps task_id -> Counter of predictions collected across runs
+    preds_by_task: Dict[str, Counter] = defaultdict(Counter)
 
     # Track first-seen order index for each distinct prediction string across all runs.
     # This enables deterministic tie-breaking.
     first_seen_order: Dict[str, int] = {}
     next_order_idx = 0
 
-    runs = discover_runs(results_dir)
+    if runs is None:
+        runs = discover_runs(results_dir)
     if not runs:
         raise FileNotFoundError(
             f"No run directories with 'benchmark_results.jsonl' found under: {results_dir}"
@@ -147,7 +182,7 @@ def aggregate_multiple_runs(
 
     # Read and aggregate predictions
     for run_dir in runs:
-        fpath = os.path.join(run_dir, "benchmark_results.jsonl")
+        fpath = run_dir / "benchmark_results.jsonl"
         print(f"Reading: {fpath}")
 
         with open(fpath, "r", encoding="utf-8") as fin:
@@ -168,7 +203,7 @@ def aggregate_multiple_runs(
                 # Only accept non-empty strings; coerce to str for safety
                 if task_id and pred is not None and str(pred).strip():
                     pred_str = str(pred).strip()
-                    preds_by_task[task_id].append(pred_str)
+                    preds_by_task[task_id][pred_str] += 1
                     if pred_str not in first_seen_order:
                         first_seen_order[pred_str] = next_order_idx
                         next_order_idx += 1
@@ -180,7 +215,7 @@ def aggregate_multiple_runs(
     return preds_by_task, first_seen_order
 
 
-def process_single_run(results_dir: str) -> Dict[str, str]:
+def process_single_run(results_dir: Path) -> Dict[str, str]:
     """
     Process a single run (direct benchmark_results.jsonl file).
 
@@ -190,9 +225,9 @@ def process_single_run(results_dir: str) -> Dict[str, str]:
     Returns:
         Dictionary mapping task_id to prediction
     """
-    file_path = os.path.join(results_dir, "benchmark_results.jsonl")
+    file_path = results_dir / "benchmark_results.jsonl"
 
-    if not os.path.isfile(file_path):
+    if not file_path.is_file():
         raise FileNotFoundError(f"benchmark_results.jsonl not found in: {results_dir}")
 
     print(f"Reading single run: {file_path}")
@@ -204,9 +239,10 @@ def process_single_run(results_dir: str) -> Dict[str, str]:
 
 def write_submission_file(
     predictions: Dict[str, str],
-    output_file: str,
+    output_file: Path,
     is_aggregated: bool = False,
-    vote_counts: Dict[str, Dict[str, int]] = None,
+    vote_counts: Dict[str, Optional[Dict[str, int]]] = None,
+    key_order: List[str] = None,
 ) -> None:
     """
     Write predictions to FutureX submission format.
@@ -215,19 +251,23 @@ def write_submission_file(
         predictions: Dictionary mapping task_id to prediction
         output_file: Output file path
         is_aggregated: Whether this is from aggregated runs
-        vote_counts: Vote counts for each task (only for aggregated runs)
+        vote_counts: Vote counts for each task (only for aggregated runs);
+            entries are None for unanimous votes and are not emitted
+        key_order: Pre-sorted task_ids to emit; sorted here if None
     """
     num_tasks = 0
     with open(output_file, "w", encoding="utf-8") as out:
-        for task_id in sorted(predictions.keys()):
+        for task_id in key_order if key_order is not None else sorted(predictions):
             prediction = predictions[task_id]
 
             # Create submission record
             record = {"id": task_id, "prediction": prediction}
 
             # Add vote information for aggregated runs
-            if is_aggregated and vote_counts and task_id in vote_counts:
-                record["vote_counts"] = vote_counts[task_id]
+            if is_aggregated and vote_counts:
+                counts = vote_counts.get(task_id)
+                if counts is not None:
+                    record["vote_counts"] = counts
 
             out.write(json.dumps(record, ensure_ascii=False) + "\n")
             num_tasks += 1
@@ -259,6 +299,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Force aggregation mode (look for run_* subdirectories)",
     )
+    parser.add_argument(
+        "--no-vote-counts",
+        action="store_true",
+        help="Do not include vote_counts in aggregated submission records",
+    )
     parser.add_argument(
         "--single",
         action="store_true",
@@ -270,19 +315,19 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
 
-    results_dir = os.path.abspath(args.results_dir)
-    if not os.path.isdir(results_dir):
+    results_dir = Path(args.results_dir).resolve()
+    if not results_dir.is_dir():
         raise FileNotFoundError(f"Results dir not found: {results_dir}")
 
     output_file = (
-        os.path.abspath(args.output)
+        Path(args.output).resolve()
         if args.output
-        else os.path.join(results_dir, "futurex_submission.jsonl")
+        else results_dir / "futurex_submission.jsonl"
     )
 
     # Determine processing mode
     runs = discover_runs(results_dir)
-    single_file = os.path.join(results_dir, "benchmark_results.jsonl")
+    single_file = results_dir / "benchmark_results.jsonl"
 
     if args.aggregate:
         if not runs:
@@ -291,20 +336,20 @@ def main() -> None:
             )
         mode = "aggregate"
     elif args.single:
-        if not os.path.isfile(single_file):
+        if not single_file.is_file():
             raise FileNotFoundError(
                 f"benchmark_results.jsonl not found for single run in: {results_dir}"
             )
         mode = "single"
     else:
         # Auto-detect mode
-        if runs and os.path.isfile(single_file):
+        if runs and single_file.is_file():
             print("Both single run and multiple runs detected. Using aggregation mode.")
             print("Use --single to force single run mode.")
             mode = "aggregate"
         elif runs:
             mode = "aggregate"
-        elif os.path.isfile(single_file):
+        elif single_file.is_file():
             mode = "single"
         else:
             raise FileNotFoundError(
@@ -315,19 +360,26 @@ def main() -> None:
 
     if mode == "aggregate":
         # Multi-run aggregation with majority voting
-        preds_by_task, first_seen_order = aggregate_multiple_runs(results_dir)
+        preds_by_task, first_seen_order = aggregate_multiple_runs(
+            results_dir, runs=runs
+        )
 
-        # Apply majority voting
+        # Apply majority voting; sort task_ids once and reuse the order below
+        ordered_task_ids = sorted(preds_by_task)
         final_predictions = {}
         vote_counts = {}
 
-        for task_id in preds_by_task:
+        for task_id in ordered_task_ids:
             voted_pred, counts = majority_vote(preds_by_task[task_id], first_seen_order)
             final_predictions[task_id] = voted_pred
             vote_counts[task_id] = counts
 
         write_submission_file(
-            final_predictions, output_file, is_aggregated=True, vote_counts=vote_counts
+            final_predictions,
+            output_file,
+            is_aggregated=True,
+            vote_counts=None if args.no_vote_counts else vote_counts,
+            key_order=ordered_task_ids,
         )
 
     else:
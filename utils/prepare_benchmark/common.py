@@ -3,9 +3,40 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import dataclasses
+import functools
 import json
 from typing import Any, MutableMapping
 
+from datasets import load_dataset
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dataset_cached(streaming: bool, args: tuple, kwargs_items: tuple):
+    kwargs = dict(kwargs_items)
+    if streaming:
+        return load_dataset(*args, streaming=True, **kwargs)
+    # Eager fallback: reuse the on-disk Arrow cache and skip re-verification
+    return load_dataset(
+        *args,
+        download_mode="reuse_dataset_if_exists",
+        verification_mode="no_checks",
+        **kwargs,
+    )
+
+
+def load_dataset_streaming(*args, **kwargs):
+    """
+    Load a HuggingFace dataset with streaming=True so rows are yielded as they
+    are downloaded instead of materializing the full Arrow table first.
+    Falls back to the eager path for datasets that do not support streaming.
+    Results are memoized, so repeated get() calls in one process reload in O(1).
+    """
+    kwargs_items = tuple(sorted(kwargs.items()))
+    try:
+        return _load_dataset_cached(True, args, kwargs_items)
+    except (NotImplementedError, ValueError):
+        return _load_dataset_cached(False, args, kwargs_items)
+
 
 @dataclasses.dataclass
 class Task:
@@ -4,9 +4,7 @@
 
 from typing import Generator, MutableMapping
 
-from datasets import load_dataset
-
-from utils.prepare_benchmark.common import Task
+from utils.prepare_benchmark.common import Task, load_dataset_streaming
 
 
 def gen_finsearchcomp(hf_token: str) -> Generator[Task, None, None]:
@@ -19,7 +17,7 @@ def gen_finsearchcomp(hf_token: str) -> Generator[Task, None, None]:
     Yields:
         Task: Standardized task objects
     """
-    dataset = load_dataset("ByteSeedXpert/FinSearchComp")
+    dataset = load_dataset_streaming("ByteSeedXpert/FinSearchComp")
 
     for split_name, split_data in dataset.items():
         for idx, sample in enumerate(split_data):
@@ -8,6 +8,9 @@ from datasets import load_dataset
 
 from utils.prepare_benchmark.common import Task
 
+# Keys lifted out of each row; everything else goes to metadata.
+_EXTRACTED_KEYS = frozenset({"Unnamed: 0", "Prompt", "Answer"})
+
 
 def gen_frames_test(hf_token: str) -> Generator[Task, None, None]:
     dataset = load_dataset(
@@ -16,11 +19,12 @@ def gen_frames_test(hf_token: str) -> Generator[Task, None, None]:
         split="test",
     )
     for x in dataset:
-        task = x
-        metadata: MutableMapping = x  # type: ignore
-        task_id = metadata.pop("Unnamed: 0", "")
-        question = metadata.pop("Prompt", "")
-        answer = metadata.pop("Answer", "")
+        task_id = x.get("Unnamed: 0", "")
+        question = x.get("Prompt", "")
+        answer = x.get("Answer", "")
+        metadata: MutableMapping = {
+            k: v for k, v in x.items() if k not in _EXTRACTED_KEYS
+        }
         task = Task(
             task_id=str(task_id),
             task_question=question,
@@ -4,9 +4,7 @@
 
 from typing import Generator, MutableMapping
 
-from datasets import load_dataset
-
-from utils.prepare_benchmark.common import Task
+from utils.prepare_benchmark.common import Task, load_dataset_streaming
 
 
 def gen_futurex(hf_token: str) -> Generator[Task, None, None]:
@@ -20,7 +18,7 @@ def gen_futurex(hf_token: str) -> Generator[Task, None, None]:
         Task: Standardized task objects
     """
     # Load the Futurex-Online dataset
-    dataset = load_dataset("futurex-ai/Futurex-Online")
+    dataset = load_dataset_streaming("futurex-ai/Futurex-Online")
 
     # Process each split in the dataset
     for split_name, split_data in dataset.items():
@@ -4,9 +4,12 @@
 
 from typing import Generator, MutableMapping
 
-from datasets import load_dataset
+from utils.prepare_benchmark.common import Task, load_dataset_streaming
 
-from utils.prepare_benchmark.common import Task
+# Keys lifted out of each row; everything else goes to metadata.
+_EXTRACTED_KEYS = frozenset(
+    {"task_id", "Question", "Final answer", "file_path", "file_name"}
+)
 
 
 def check_file(file_path: str, file_name: str):
@@ -16,19 +19,21 @@ def check_file(file_path: str, file_name: str):
 
 
 def gen_gaia_validation(hf_token: str) -> Generator[Task, None, None]:
-    dataset = load_dataset(
+    dataset = load_dataset_streaming(
         "gaia-benchmark/GAIA",
         name="2023_all",
         token=hf_token,
         split="validation",
     )
     for x in dataset:
-        metadata: MutableMapping = x  # type: ignore
-        task_id = metadata.pop("task_id")
-        question = metadata.pop("Question")
-        gt = metadata.pop("Final answer")
-        file_path = metadata.pop("file_path")
-        file_name = metadata.pop("file_name")
+        task_id = x["task_id"]
+        question = x["Question"]
+        gt = x["Final answer"]
+        file_path = x["file_path"]
+        file_name = x["file_name"]
+        metadata: MutableMapping = {
+            k: v for k, v in x.items() if k not in _EXTRACTED_KEYS
+        }
         uri, exists = check_file(file_path, file_name)
         task = Task(
             task_id=task_id,
@@ -6,19 +6,25 @@
 https://raw.githubusercontent.com/RUC-NLPIR/WebThinker/refs/heads/main/data/GAIA/dev.json
 """
 
-import json
 from typing import Generator, MutableMapping
 
 import requests
 
 from utils.prepare_benchmark.common import Task
 
+try:
+    # orjson parses the raw bytes ~3x faster; fall back to stdlib json.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 def gen_gaia_text_only() -> Generator[Task, None, None]:
-    response = requests.get(
-        "https://raw.githubusercontent.com/RUC-NLPIR/WebThinker/refs/heads/main/data/GAIA/dev.json"
-    )
-    dataset = json.loads(response.content)
+    with requests.get(
+        "https://raw.githubusercontent.com/RUC-NLPIR/WebThinker/refs/heads/main/data/GAIA/dev.json",
+        stream=True,
+    ) as response:
+        dataset = _json_loads(response.content)
     for row in dataset:
         metadata: MutableMapping = row
         task_id = metadata.pop("task_id", "")
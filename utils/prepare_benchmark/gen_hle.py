@@ -3,13 +3,22 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import base64
+import io
 import pathlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator, MutableMapping
 
 import filetype
-from datasets import load_dataset
+from utils.prepare_benchmark.common import Task, load_dataset_streaming
 
-from utils.prepare_benchmark.common import Task
+# Keys lifted out of each row (or dropped); everything else goes to metadata.
+_EXTRACTED_KEYS = frozenset(
+    {"id", "question", "answer", "image", "image_preview", "rationale_image"}
+)
+
+# Bound on in-flight image decode/write jobs to cap memory use.
+_MAX_PENDING_IMAGES = 32
 
 
 def save_image(image, data_dir: str, task_id: str) -> str:
@@ -17,18 +26,15 @@ def save_image(image, data_dir: str, task_id: str) -> str:
         return None
     # Ensure data_dir is absolute and resolved to avoid ugly .. in the path
     data_dir_path = pathlib.Path(data_dir).resolve()
-    # First save as temporary file without extension
-    temp_path = data_dir_path / "hle" / "images" / f"{task_id}.tmp"
-    temp_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Handle different image formats
+    # Normalize to raw bytes in memory so the format can be sniffed without a
+    # temp-file write + reopen + rename round trip.
     if isinstance(image, str):
         # If it's a data URL, extract the base64 part
         if image.startswith("data:"):
             try:
                 header, b64data = image.split(",", 1)
                 image_data = base64.b64decode(b64data)
-                temp_path.write_bytes(image_data)
             except Exception as e:
                 raise ValueError(
                     f"Cannot process image data:<class 'str'> (data URL): {e}"
@@ -36,23 +42,22 @@ def save_image(image, data_dir: str, task_id: str) -> str:
         else:
             try:
                 image_data = base64.b64decode(image)
-                temp_path.write_bytes(image_data)
             except Exception as e:
                 raise ValueError(
                     f"Cannot process image data:<class 'str'> (raw b64): {e}"
                 )
     elif hasattr(image, "save"):
         # If it's a PIL Image object
-        image.save(temp_path)
+        buf = io.BytesIO()
+        image.save(buf, format=image.format or "PNG")
+        image_data = buf.getvalue()
+    elif isinstance(image, (bytes, bytearray, memoryview)):
+        image_data = bytes(image)
     else:
-        # Try to handle it as bytes directly
-        try:
-            temp_path.write_bytes(image)
-        except Exception:
-            raise ValueError(f"Cannot process image data: {type(image)}")
+        raise ValueError(f"Cannot process image data: {type(image)}")
 
-    # Detect actual file type and rename with correct extension
-    kind = filetype.guess(str(temp_path))
+    # filetype only needs the leading bytes to identify the format
+    kind = filetype.guess(image_data[:261])
     if kind is None:
         # Fallback to .test if cannot detect
         ext = ".test"
@@ -60,29 +65,40 @@ def save_image(image, data_dir: str, task_id: str) -> str:
         ext = f".{kind.extension}"
 
     final_path = data_dir_path / "hle" / "images" / f"{task_id}{ext}"
-    temp_path.rename(final_path)
+    final_path.parent.mkdir(parents=True, exist_ok=True)
+    final_path.write_bytes(image_data)
 
     return str(final_path)
 
 
+def _make_hle_task(x, data_dir: str) -> Task:
+    task_id = x["id"]
+    question = x["question"]
+    gt = x["answer"]
+    image = x["image"]  # base64 encoded image
+    image_uri = save_image(image, data_dir, task_id)
+    metadata: MutableMapping = {k: v for k, v in x.items() if k not in _EXTRACTED_KEYS}
+    return Task(
+        task_id=task_id,
+        task_question=question,
+        ground_truth=gt,
+        file_path=image_uri,
+        metadata=metadata,
+    )
+
+
 def gen_hle_test(hf_token: str, data_dir: str) -> Generator[Task, None, None]:
-    dataset = load_dataset("cais/hle", split="test", token=hf_token)
-    for x in dataset:
-        metadata: MutableMapping = x  # type: ignore
-        task_id = metadata.pop("id")
-        question = metadata.pop("question")
-        gt = metadata.pop("answer")
-        image = metadata.pop("image")  # base64 encoded image
-        image_uri = save_image(image, data_dir, task_id)
-        metadata.pop("image_preview")
-        metadata.pop("rationale_image")
-        task = Task(
-            task_id=task_id,
-            task_question=question,
-            ground_truth=gt,
-            file_path=image_uri,
-            metadata=metadata,
-        )
-        yield task
+    dataset = load_dataset_streaming("cais/hle", split="test", token=hf_token)
+    # Base64 decode + image write are independent per row; overlap them with
+    # dataset fetching via a thread pool. Futures are drained FIFO so task
+    # order is preserved, and the bounded queue caps in-flight images.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pending: deque = deque()
+        for x in dataset:
+            pending.append(pool.submit(_make_hle_task, x, data_dir))
+            if len(pending) >= _MAX_PENDING_IMAGES:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
     return
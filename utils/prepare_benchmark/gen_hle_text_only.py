@@ -3,24 +3,35 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import json
 from typing import Generator, MutableMapping
 
 import requests
 
 from utils.prepare_benchmark.common import Task
 
+# Keys lifted out of each row; everything else goes to metadata.
+_EXTRACTED_KEYS = frozenset({"id", "Question", "answer"})
+
+try:
+    # orjson parses the raw bytes ~3x faster; fall back to stdlib json.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 def gen_hle_text_only(hf_token: str) -> Generator[Task, None, None]:
-    response = requests.get(
-        "https://raw.githubusercontent.com/RUC-NLPIR/WebThinker/refs/heads/main/data/HLE/test.json"
-    )
-    dataset = json.loads(response.content)
+    with requests.get(
+        "https://raw.githubusercontent.com/RUC-NLPIR/WebThinker/refs/heads/main/data/HLE/test.json",
+        stream=True,
+    ) as response:
+        dataset = _json_loads(response.content)
     for row in dataset:
-        metadata: MutableMapping = row
-        task_id = str(metadata.pop("id", ""))
-        question = metadata.pop("Question", "")
-        answer = metadata.pop("answer", "")
+        task_id = str(row.get("id", ""))
+        question = row.get("Question", "")
+        answer = row.get("answer", "")
+        metadata: MutableMapping = {
+            k: v for k, v in row.items() if k not in _EXTRACTED_KEYS
+        }
         task = Task(
             task_id=task_id,
             task_question=question,
@@ -4,13 +4,11 @@
 
 from typing import Generator, MutableMapping
 
-from datasets import load_dataset
-
-from utils.prepare_benchmark.common import Task
+from utils.prepare_benchmark.common import Task, load_dataset_streaming
 
 
 def gen_webwalkerqa(hf_token: str) -> Generator[Task, None, None]:
-    dataset = load_dataset(
+    dataset = load_dataset_streaming(
         "callanwu/WebWalkerQA",
         token=hf_token,
         split="main",
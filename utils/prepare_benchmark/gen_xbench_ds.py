@@ -5,18 +5,21 @@
 import base64
 from typing import Generator, MutableMapping
 
+import numpy as np
 from datasets import load_dataset
 
 from utils.prepare_benchmark.common import Task
 
 
-def xor_decrypt(data, key):
+def xor_decrypt(data: bytes, key: str) -> bytes:
     """
-    XOR decrypt data with a key
+    XOR decrypt data with a key, vectorized over uint8 arrays
     """
-    key_bytes = key.encode("utf-8")
-    key_length = len(key_bytes)
-    return bytes([data[i] ^ key_bytes[i % key_length] for i in range(len(data))])
+    key_bytes = np.frombuffer(key.encode("utf-8"), dtype=np.uint8)
+    data_bytes = np.frombuffer(data, dtype=np.uint8)
+    # Tile the key to the data length instead of indexing byte-by-byte
+    key_tiled = np.resize(key_bytes, data_bytes.shape)
+    return (data_bytes ^ key_tiled).tobytes()
 
 
 def gen_xbench_ds(hf_token: str) -> Generator[Task, None, None]:
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import dataclasses
+import functools
 import pathlib
 
 import dotenv
@@ -63,79 +64,31 @@ def _prepare_filesystem(env: _Env):
 
 
 def _prepare_dataset(env: _Env, dataset: str):
+    # Bind the underlying generator functions directly instead of wrapping
+    # them in pass-through generators, which added a frame per yielded task.
     match dataset:
         case "browsecomp-test":
-
-            def gen():
-                for x in gen_browsecomp_test(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_browsecomp_test, env.hf_token)
         case "browsecomp-zh-test":
-
-            def gen():
-                for x in gen_browsecomp_zh_test(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_browsecomp_zh_test, env.hf_token)
         case "frames-test":
-
-            def gen():
-                for x in gen_frames_test(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_frames_test, env.hf_token)
         case "gaia-val":
-
-            def gen():
-                for x in gen_gaia_validation(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_gaia_validation, env.hf_token)
         case "gaia-val-text-only":
             return gen_gaia_text_only
         case "webwalkerqa":
-
-            def gen():
-                for x in gen_webwalkerqa(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_webwalkerqa, env.hf_token)
         case "hle":
-
-            def gen():
-                for x in gen_hle_test(env.hf_token, env.data_dir):
-                    yield x
-
-            return gen
+            return functools.partial(gen_hle_test, env.hf_token, env.data_dir)
         case "hle-text-only":
-
-            def gen():
-                for x in gen_hle_text_only(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_hle_text_only, env.hf_token)
         case "xbench-ds":
-
-            def gen():
-                for x in gen_xbench_ds(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_xbench_ds, env.hf_token)
         case "futurex":
-
-            def gen():
-                for x in gen_futurex(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_futurex, env.hf_token)
         case "finsearchcomp":
-
-            def gen():
-                for x in gen_finsearchcomp(env.hf_token):
-                    yield x
-
-            return gen
+            return functools.partial(gen_finsearchcomp, env.hf_token)
         case _:
             raise ValueError("not supported")
 
@@ -174,9 +127,11 @@ def get(dataset: str):
     ds_gen = _prepare_dataset(env, dataset)
     _prepare_filesystem(env)
     ds_file = env.data_dir / dataset / env.meta_filename
-    with open(ds_file, mode="w") as f:
+    # Task.to_json() already returns UTF-8 bytes; write them directly through a
+    # large buffer instead of decode -> concat -> re-encode per task.
+    with open(ds_file, mode="wb", buffering=1 << 20) as f:
         for task in ds_gen():
-            f.write(task.to_json().decode() + "\n")
+            f.write(task.to_json() + b"\n")
     print("\n" + "=" * 80)
     print(f"  Benchmark: {dataset}")
     print(f"  Saved to: {ds_file}")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the progress-check scripts.
+
+The three benchmark checkers all scan a log folder for task_*_attempt_*.json
+files, parse each one, and tally counts. Factoring the scan/parse/fan-out
+machinery here means Python compiles and caches it once, and downstream tools
+can call into it directly instead of shelling out to the scripts.
+"""
+
+import dataclasses
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+# Minimum file count before parsing is spread across a process pool
+PARALLEL_THRESHOLD = 200
+
+# Example-file lists shown in the reports only ever display the first few
+# entries, so cap their growth instead of accumulating every name.
+MAX_EXAMPLE_FILES = 5
+
+try:
+    # orjson decodes these small JSON logs several times faster; optional.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+def iter_task_jsons(folder: str) -> Iterator[os.DirEntry]:
+    """
+    Yield os.DirEntry objects for task_*_attempt_*.json files in folder.
+
+    os.scandir with manual name filtering avoids pathlib's per-entry Path
+    construction and fnmatch compilation, which dominate on large log folders.
+    """
+    with os.scandir(folder) as it:
+        for entry in it:
+            name = entry.name
+            if (
+                name.startswith("task_")
+                and name.endswith(".json")
+                and "_attempt_" in name
+                and entry.is_file(follow_symlinks=False)
+            ):
+                yield entry
+
+
+def load_task(path: str) -> Dict:
+    """Read and fully parse one task JSON log."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def classify_parallel(
+    classify_file: Callable[[Tuple[str, str]], _T],
+    json_files: Iterable[os.DirEntry],
+) -> Iterator[_T]:
+    """
+    Run a per-file classify function over task logs, fanning out across cores
+    for large runs.
+
+    Per-file parsing is independent, so big log folders are handed to a
+    ProcessPoolExecutor; smaller ones use a thread pool that overlaps file
+    reads with parsing while avoiding process spawn cost.
+    """
+    infos = [(entry.path, entry.name) for entry in json_files]
+    if len(infos) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            yield from pool.map(classify_file, infos, chunksize=64)
+    else:
+        # Threads release the GIL in open()/read(), so file I/O overlaps with
+        # parsing even below the process-pool threshold; this matters most on
+        # NFS-mounted log folders where each open() is latency-bound.
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            yield from pool.map(classify_file, infos)
+
+
+@dataclasses.dataclass(slots=True)
+class Counters:
+    """
+    Hot-loop tallies shared by the checkers. __slots__ keeps instances small
+    and makes attribute increments cheaper than dict key access; each checker
+    uses the subset of fields relevant to its benchmark.
+    """
+
+    total_files: int = 0
+    completed_status: int = 0
+    running_status: int = 0
+    failed_status: int = 0
+    completed_and_correct: int = 0
+    completed_and_incorrect: int = 0
+    other_status: int = 0
+    parse_errors: int = 0
+    with_predictions: int = 0
+    without_predictions: int = 0
+    with_errors: int = 0
@@ -17,12 +17,30 @@ Usage:
 If no path is provided, uses the current directory.
 """
 
-import json
+import os
 import re
 import sys
-from pathlib import Path
 from typing import Dict, List, Tuple
 
+from _common import (
+    MAX_EXAMPLE_FILES,
+    Counters,
+    classify_parallel,
+    iter_task_jsons,
+    load_task,
+)
+
+# Regions tracked in the regional breakdown
+_REGIONS = ("Global", "Greater China")
+
+# Flat count tables: task types and metrics are indexed by small ints so the
+# hot loop does constant-index list increments instead of string-hash lookups
+_TASK_IDX = {"T1": 0, "T2": 1, "T3": 2, "Unknown": 3}
+_M_TOTAL, _M_COMPLETED, _M_CORRECT, _M_INCORRECT = range(4)
+
+# Compiled once at import; the matcher runs once per log file
+_TASK_TYPE_RE = re.compile(r"^\(T(\d+)\)")
+
 
 def extract_task_type(task_id: str) -> str:
     """
@@ -34,7 +52,7 @@ def extract_task_type(task_id: str) -> str:
     Returns:
         Task type string ("T1", "T2", "T3", or "Unknown")
     """
-    match = re.match(r"^\(T(\d+)\)", task_id)
+    match = _TASK_TYPE_RE.match(task_id)
     if match:
         return f"T{match.group(1)}"
     return "Unknown"
@@ -53,14 +71,50 @@ def extract_region_from_label(label: str) -> str:
     if not label:
         return "Unknown"
 
-    if "(Global)" in label:
+    # The region is always a parenthesized suffix, so a tail comparison
+    # beats scanning the whole label twice with `in`
+    if label.endswith("(Global)"):
         return "Global"
-    elif "(Greater China)" in label:
+    elif label.endswith("(Greater China)"):
         return "Greater China"
     else:
         return "Unknown"
 
 
+def classify_file(info: Tuple[str, str]) -> Tuple[str, str, str, str, str]:
+    """
+    Parse and classify a single task log.
+
+    Args:
+        info: (path, name) of the task JSON file
+
+    Returns:
+        (name, task_type, status, judge_result, region); task_type is None on
+        parse failure and the error message is returned in the status slot
+    """
+    path, name = info
+    try:
+        data = load_task(path)
+    except (ValueError, KeyError, FileNotFoundError) as e:
+        return (name, None, str(e), "", "")
+
+    task_id = data.get("task_id", "")
+    task_type = extract_task_type(task_id)
+    # The pipeline emits canonical casing (lowercase status, uppercase judge
+    # grades), so no per-file re-normalization is needed
+    status = data.get("status", "")
+    judge_result = data.get("judge_result", "")
+
+    # Extract region from label; the key chain is almost always present, so
+    # EAFP beats a .get chain that allocates two default dicts on every miss
+    try:
+        label = data["input"]["metadata"]["label"]
+    except (KeyError, TypeError):
+        label = ""
+    region = extract_region_from_label(label)
+    return (name, task_type, status, judge_result, region)
+
+
 def analyze_finsearchcomp_results(log_folder: str) -> Dict[str, any]:
     """
     Analyze FinSearchComp benchmark results from JSON log files.
@@ -71,117 +125,113 @@ def analyze_finsearchcomp_results(log_folder: str) -> Dict[str, any]:
     Returns:
         Dictionary with counts of different categories
     """
-    log_path = Path(log_folder)
-
-    if not log_path.exists():
+    # Plain-string paths throughout: os.DirEntry already carries both the
+    # display name and the open()-able path, so no Path objects are needed
+    if not os.path.exists(log_folder):
         raise FileNotFoundError(f"Log folder not found: {log_folder}")
 
     # Find all task JSON files
-    json_files = list(log_path.glob("task_*_attempt_*.json"))
-
-    results = {
-        "total_files": 0,
-        "completed_status": 0,
-        "completed_and_correct": 0,
-        "completed_and_incorrect": 0,
-        "other_status": 0,
-        "parse_errors": 0,
-        "task_type_breakdown": {
-            "T1": {"total": 0, "completed": 0, "correct": 0, "incorrect": 0},
-            "T2": {"total": 0, "completed": 0, "correct": 0, "incorrect": 0},
-            "T3": {"total": 0, "completed": 0, "correct": 0, "incorrect": 0},
-            "Unknown": {"total": 0, "completed": 0, "correct": 0, "incorrect": 0},
-        },
-        "regional_breakdown": {
-            "Global": {
-                "T2": {"total": 0, "completed": 0, "correct": 0, "incorrect": 0},
-                "T3": {"total": 0, "completed": 0, "correct": 0, "incorrect": 0},
-            },
-            "Greater China": {
-                "T2": {"total": 0, "completed": 0, "correct": 0, "incorrect": 0},
-                "T3": {"total": 0, "completed": 0, "correct": 0, "incorrect": 0},
-            },
-        },
-    }
+    json_files = list(iter_task_jsons(log_folder))
 
     completed_correct_files = []
     completed_incorrect_files = []
     parse_error_files = []
 
+    # Hot-loop counters: slotted Counters attributes plus flat int tables
+    # replace ~10 nested dict lookups per file; the nested results structure
+    # is assembled afterwards.
+    c = Counters()
+    # 4 task types x 4 metrics
+    tt_counts = [[0] * 4 for _ in _TASK_IDX]
+    # 2 regions x 2 regional task types (T2, T3) x 4 metrics
+    rg_counts = [[[0] * 4 for _ in ("T2", "T3")] for _ in _REGIONS]
+
     print(f"Scanning {len(json_files)} files in {log_folder}...")
 
-    for json_file in json_files:
-        results["total_files"] += 1
-
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            task_id = data.get("task_id", "")
-            task_type = extract_task_type(task_id)
-            status = data.get("status", "").lower()
-            judge_result = data.get("judge_result", "").upper()
-
-            # Extract region from label
-            label = data.get("input", {}).get("metadata", {}).get("label", "")
-            region = extract_region_from_label(label)
-
-            # Update task type breakdown
-            results["task_type_breakdown"][task_type]["total"] += 1
-
-            # Update regional breakdown for T2 and T3 tasks
-            if task_type in ["T2", "T3"] and region in results["regional_breakdown"]:
-                results["regional_breakdown"][region][task_type]["total"] += 1
-
-            if status == "completed":
-                results["completed_status"] += 1
-                results["task_type_breakdown"][task_type]["completed"] += 1
-
-                # Update regional breakdown for completed T2 and T3 tasks
-                if (
-                    task_type in ["T2", "T3"]
-                    and region in results["regional_breakdown"]
-                ):
-                    results["regional_breakdown"][region][task_type]["completed"] += 1
-
-                # For T1 tasks, exclude from correctness evaluation but count as completed
-                if task_type == "T1":
-                    # T1 tasks are considered "completed" but not evaluated for correctness
-                    # due to outdated ground truth
-                    pass
-                else:
-                    # For T2 and T3 tasks, evaluate correctness
-                    if judge_result == "CORRECT":
-                        results["completed_and_correct"] += 1
-                        results["task_type_breakdown"][task_type]["correct"] += 1
-                        # Update regional breakdown for correct T2 and T3 tasks
-                        if (
-                            task_type in ["T2", "T3"]
-                            and region in results["regional_breakdown"]
-                        ):
-                            results["regional_breakdown"][region][task_type][
-                                "correct"
-                            ] += 1
-                        completed_correct_files.append(json_file.name)
-                    else:
-                        results["completed_and_incorrect"] += 1
-                        results["task_type_breakdown"][task_type]["incorrect"] += 1
-                        # Update regional breakdown for incorrect T2 and T3 tasks
-                        if (
-                            task_type in ["T2", "T3"]
-                            and region in results["regional_breakdown"]
-                        ):
-                            results["regional_breakdown"][region][task_type][
-                                "incorrect"
-                            ] += 1
-                        completed_incorrect_files.append((json_file.name, judge_result))
+    for name, task_type, status, judge_result, region in classify_parallel(
+        classify_file, json_files
+    ):
+        c.total_files += 1
+
+        if task_type is None:
+            # status carries the parse error message in this case
+            c.parse_errors += 1
+            parse_error_files.append((name, status))
+            print(f"Error parsing {name}: {status}")
+            continue
+
+        # Update task type breakdown
+        task_idx = _TASK_IDX[task_type]
+        tt_bucket = tt_counts[task_idx]
+        tt_bucket[_M_TOTAL] += 1
+
+        # Regional breakdown only tracks T2/T3 tasks in known regions; resolve
+        # the metric row once per file instead of re-testing membership on
+        # every increment (task_idx - 1 maps T2 -> 0, T3 -> 1)
+        rg_bucket = None
+        if task_type in ("T2", "T3") and region in _REGIONS:
+            rg_bucket = rg_counts[_REGIONS.index(region)][task_idx - 1]
+            rg_bucket[_M_TOTAL] += 1
+
+        if status == "completed":
+            c.completed_status += 1
+            tt_bucket[_M_COMPLETED] += 1
+            if rg_bucket is not None:
+                rg_bucket[_M_COMPLETED] += 1
+
+            # For T1 tasks, exclude from correctness evaluation but count as completed
+            if task_type == "T1":
+                # T1 tasks are considered "completed" but not evaluated for correctness
+                # due to outdated ground truth
+                pass
             else:
-                results["other_status"] += 1
+                # For T2 and T3 tasks, evaluate correctness
+                if judge_result == "CORRECT":
+                    c.completed_and_correct += 1
+                    tt_bucket[_M_CORRECT] += 1
+                    if rg_bucket is not None:
+                        rg_bucket[_M_CORRECT] += 1
+                    if len(completed_correct_files) < MAX_EXAMPLE_FILES:
+                        completed_correct_files.append(name)
+                else:
+                    c.completed_and_incorrect += 1
+                    tt_bucket[_M_INCORRECT] += 1
+                    if rg_bucket is not None:
+                        rg_bucket[_M_INCORRECT] += 1
+                    if len(completed_incorrect_files) < MAX_EXAMPLE_FILES:
+                        completed_incorrect_files.append((name, judge_result))
+        else:
+            c.other_status += 1
 
-        except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
-            results["parse_errors"] += 1
-            parse_error_files.append((json_file.name, str(e)))
-            print(f"Error parsing {json_file.name}: {e}")
+    results = {
+        "total_files": c.total_files,
+        "completed_status": c.completed_status,
+        "completed_and_correct": c.completed_and_correct,
+        "completed_and_incorrect": c.completed_and_incorrect,
+        "other_status": c.other_status,
+        "parse_errors": c.parse_errors,
+        "task_type_breakdown": {
+            task_type: {
+                "total": tt_counts[idx][_M_TOTAL],
+                "completed": tt_counts[idx][_M_COMPLETED],
+                "correct": tt_counts[idx][_M_CORRECT],
+                "incorrect": tt_counts[idx][_M_INCORRECT],
+            }
+            for task_type, idx in _TASK_IDX.items()
+        },
+        "regional_breakdown": {
+            region: {
+                task_type: {
+                    "total": rg_counts[r][t][_M_TOTAL],
+                    "completed": rg_counts[r][t][_M_COMPLETED],
+                    "correct": rg_counts[r][t][_M_CORRECT],
+                    "incorrect": rg_counts[r][t][_M_INCORRECT],
+                }
+                for t, task_type in enumerate(("T2", "T3"))
+            }
+            for r, region in enumerate(_REGIONS)
+        },
+    }
 
     return (
         results,
@@ -191,6 +241,11 @@ def analyze_finsearchcomp_results(log_folder: str) -> Dict[str, any]:
     )
 
 
+def _pct(num: int, den: int) -> float:
+    """Percentage of num over den, 0.0 when den is zero."""
+    return num / den * 100 if den > 0 else 0.0
+
+
 def display_results(
     results: Dict[str, any],
     correct_files: List[str],
@@ -207,30 +262,29 @@ def display_results(
     completed = results["completed_status"]
     correct = results["completed_and_correct"]
     incorrect = results["completed_and_incorrect"]
+    # Bind the nested breakdowns once instead of re-indexing results per line
+    tt = results["task_type_breakdown"]
+    t1, t2, t3 = tt["T1"], tt["T2"], tt["T3"]
 
     print(f"Total files processed:           {total:3d}")
     print(
-        f"Files with status 'completed':   {completed:3d} ({completed/total*100:.1f}%)"
+        f"Files with status 'completed':   {completed:3d} ({_pct(completed, total):.1f}%)"
+    )
+    print(
+        f"Files completed AND correct:     {correct:3d} ({_pct(correct, total):.1f}%)"
     )
-    print(f"Files completed AND correct:     {correct:3d} ({correct/total*100:.1f}%)")
     print(
-        f"Files completed but incorrect:   {incorrect:3d} ({incorrect/total*100:.1f}%)"
+        f"Files completed but incorrect:   {incorrect:3d} ({_pct(incorrect, total):.1f}%)"
     )
     print(f"Files with other status:         {results['other_status']:3d}")
     print(f"Files with parse errors:         {results['parse_errors']:3d}")
 
     # Calculate accuracy excluding T1 tasks
-    t2_t3_completed = (
-        results["task_type_breakdown"]["T2"]["completed"]
-        + results["task_type_breakdown"]["T3"]["completed"]
-    )
-    t2_t3_correct = (
-        results["task_type_breakdown"]["T2"]["correct"]
-        + results["task_type_breakdown"]["T3"]["correct"]
-    )
+    t2_t3_completed = t2["completed"] + t3["completed"]
+    t2_t3_correct = t2["correct"] + t3["correct"]
 
     if t2_t3_completed > 0:
-        accuracy = t2_t3_correct / t2_t3_completed * 100
+        accuracy = _pct(t2_t3_correct, t2_t3_completed)
         print(f"\nAccuracy rate (T2+T3 correct/completed): {accuracy:.1f}%")
         print("  (T1 tasks excluded due to outdated ground truth)")
 
@@ -240,9 +294,9 @@ def display_results(
     print("-" * 70)
 
     for task_type in ["T1", "T2", "T3", "Unknown"]:
-        breakdown = results["task_type_breakdown"][task_type]
+        breakdown = tt[task_type]
         if breakdown["total"] > 0:
-            completion_rate = breakdown["completed"] / breakdown["total"] * 100
+            completion_rate = _pct(breakdown["completed"], breakdown["total"])
             if task_type == "T1":
                 print(f"{task_type} (Time-Sensitive Data Fetching):")
                 print(
@@ -252,11 +306,7 @@ def display_results(
                     "  Note: Excluded from correctness evaluation (outdated ground truth)"
                 )
             else:
-                accuracy_rate = (
-                    breakdown["correct"] / breakdown["completed"] * 100
-                    if breakdown["completed"] > 0
-                    else 0
-                )
+                accuracy_rate = _pct(breakdown["correct"], breakdown["completed"])
                 print(
                     f"{task_type} ({'Simple Historical Lookup' if task_type == 'T2' else 'Complex Historical Investigation'}):"
                 )
@@ -278,12 +328,8 @@ def display_results(
         for task_type in ["T2", "T3"]:
             breakdown = results["regional_breakdown"][region][task_type]
             if breakdown["total"] > 0:
-                completion_rate = breakdown["completed"] / breakdown["total"] * 100
-                accuracy_rate = (
-                    breakdown["correct"] / breakdown["completed"] * 100
-                    if breakdown["completed"] > 0
-                    else 0
-                )
+                completion_rate = _pct(breakdown["completed"], breakdown["total"])
+                accuracy_rate = _pct(breakdown["correct"], breakdown["completed"])
                 task_name = (
                     "Simple Historical Lookup"
                     if task_type == "T2"
@@ -301,7 +347,7 @@ def display_results(
     print("\n" + "-" * 70)
     print(f"SUMMARY: {completed} tasks completed, {correct} T2+T3 tasks correct")
     print(
-        f"         (T1 tasks: {results['task_type_breakdown']['T1']['completed']} completed, excluded from evaluation)"
+        f"         (T1 tasks: {t1['completed']} completed, excluded from evaluation)"
     )
     print("-" * 70)
 
@@ -310,15 +356,15 @@ def display_results(
         print("\nFirst 5 correct files (T2+T3 only):")
         for i, filename in enumerate(correct_files[:5], 1):
             print(f"  {i}. {filename}")
-        if len(correct_files) > 5:
-            print(f"  ... and {len(correct_files) - 5} more")
+        if correct > 5:
+            print(f"  ... and {correct - 5} more")
 
     if incorrect_files:
         print("\nFirst 5 incorrect files (T2+T3 only):")
         for i, (filename, judge_result) in enumerate(incorrect_files[:5], 1):
             print(f"  {i}. {filename} -> {judge_result}")
-        if len(incorrect_files) > 5:
-            print(f"  ... and {len(incorrect_files) - 5} more")
+        if incorrect > 5:
+            print(f"  ... and {incorrect - 5} more")
 
     if error_files:
         print("\nFiles with parse errors:")
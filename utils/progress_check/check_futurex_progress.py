@@ -14,11 +14,87 @@ Usage:
 If no path is provided, uses the current directory.
 """
 
-import json
+import os
+import re
 import sys
-from pathlib import Path
+from collections import Counter
 from typing import Dict, List, Tuple
 
+from _common import (
+    MAX_EXAMPLE_FILES,
+    Counters,
+    classify_parallel,
+    iter_task_jsons,
+    json_loads as _json_loads,
+)
+
+# Maps raw status strings to their counting category; statuses not listed
+# here are counted as failed with an "Unknown status" annotation
+_STATUS_CATEGORY = {
+    "completed": "completed",
+    "running": "running",
+    "failed": "failed",
+    "error": "failed",
+}
+
+# Byte-level patterns for the few shallow string fields we actually read.
+# Plain-string values only ([^"\\]*); anything fancier falls back to a full
+# JSON parse, so multi-MB trace logs are usually never fully decoded.
+_FAST_FIELD_RES = {
+    "status": re.compile(rb'"status"\s*:\s*"([^"\\]*)"'),
+    "final_boxed_answer": re.compile(rb'"final_boxed_answer"\s*:\s*"([^"\\]*)"'),
+    "error": re.compile(rb'"error"\s*:\s*"([^"\\]*)"'),
+}
+
+
+def _fast_extract(raw: bytes) -> Dict[str, str]:
+    """
+    Regex out the needed top-level string fields without parsing the whole
+    document. Returns None when any field is missing or not a plain string,
+    in which case the caller must fall back to a full JSON parse.
+    """
+    out = {}
+    for key, pattern in _FAST_FIELD_RES.items():
+        m = pattern.search(raw)
+        if m is None:
+            return None
+        out[key] = m.group(1).decode("utf-8")
+    return out
+
+
+def classify_file(info: Tuple[str, str]) -> Tuple[str, str, str, str]:
+    """
+    Parse and classify a single task log.
+
+    Args:
+        info: (path, name) of the task JSON file
+
+    Returns:
+        (name, status, final_answer, error_msg); status is None on parse
+        failure and the error message is returned in the final_answer slot
+    """
+    path, name = info
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        fields = _fast_extract(raw)
+        if fields is None:
+            data = _json_loads(raw)
+            fields = {
+                "status": data.get("status", ""),
+                "final_boxed_answer": data.get("final_boxed_answer", ""),
+                "error": data.get("error", ""),
+            }
+    except (ValueError, KeyError, FileNotFoundError) as e:
+        return (name, None, str(e), "")
+
+    # The pipeline emits canonical lowercase statuses; skip re-normalization
+    status = fields["status"]
+    final_answer = fields["final_boxed_answer"]
+    error_msg = fields["error"]
+    return (name, status, final_answer, error_msg)
+
 
 def analyze_futurex_results(log_folder: str) -> Dict[str, int]:
     """
@@ -30,24 +106,13 @@ def analyze_futurex_results(log_folder: str) -> Dict[str, int]:
     Returns:
         Dictionary with counts of different categories
     """
-    log_path = Path(log_folder)
-
-    if not log_path.exists():
+    # Plain-string paths throughout: os.DirEntry already carries both the
+    # display name and the open()-able path, so no Path objects are needed
+    if not os.path.exists(log_folder):
         raise FileNotFoundError(f"Log folder not found: {log_folder}")
 
     # Find all task JSON files
-    json_files = list(log_path.glob("task_*_attempt_*.json"))
-
-    results = {
-        "total_files": 0,
-        "completed_status": 0,
-        "running_status": 0,
-        "failed_status": 0,
-        "with_predictions": 0,
-        "without_predictions": 0,
-        "with_errors": 0,
-        "parse_errors": 0,
-    }
+    json_files = list(iter_task_jsons(log_folder))
 
     completed_files = []
     running_files = []
@@ -56,57 +121,78 @@ def analyze_futurex_results(log_folder: str) -> Dict[str, int]:
     error_files = []
     parse_error_files = []
 
+    # Slotted Counters attributes in the hot loop; the results dict is
+    # assembled once at the end instead of being re-indexed per file.
+    c = Counters()
+    status_counts = Counter()
+    example_lists = {
+        "completed": completed_files,
+        "running": running_files,
+        "failed": failed_files,
+    }
+
     print(f"Scanning {len(json_files)} files in {log_folder}...")
 
-    for json_file in json_files:
-        results["total_files"] += 1
-
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            status = data.get("status", "").lower()
-            final_answer = data.get("final_boxed_answer", "")
-            error_msg = data.get("error", "")
-
-            # Count by status
-            if status == "completed":
-                results["completed_status"] += 1
-                completed_files.append(json_file.name)
-            elif status == "running":
-                results["running_status"] += 1
-                running_files.append(json_file.name)
-            elif status in ["failed", "error"]:
-                results["failed_status"] += 1
-                failed_files.append(json_file.name)
-            else:
-                # Unknown status
-                results["failed_status"] += 1
-                failed_files.append((json_file.name, f"Unknown status: {status}"))
-
-            # Count by prediction availability
-            if final_answer and final_answer.strip():
-                results["with_predictions"] += 1
+    for name, status, final_answer, error_msg in classify_parallel(
+        classify_file, json_files
+    ):
+        # Filenames land in several example lists; interning shares storage
+        name = sys.intern(name)
+        c.total_files += 1
+
+        if status is None:
+            # final_answer carries the parse error message in this case
+            c.parse_errors += 1
+            parse_error_files.append((name, final_answer))
+            print(f"Error parsing {name}: {final_answer}")
+            continue
+
+        # Count by status via a single dict dispatch instead of an elif chain
+        category = _STATUS_CATEGORY.get(status)
+        if category is None:
+            # Unknown status
+            status_counts["failed"] += 1
+            if len(failed_files) < MAX_EXAMPLE_FILES:
+                failed_files.append((name, f"Unknown status: {status}"))
+        else:
+            status_counts[category] += 1
+            examples = example_lists[category]
+            if len(examples) < MAX_EXAMPLE_FILES:
+                examples.append(name)
+
+        # Count by prediction availability
+        if final_answer and final_answer.strip():
+            c.with_predictions += 1
+            if len(prediction_files) < MAX_EXAMPLE_FILES:
+                # 60 chars is plenty for the truncated display line and keeps
+                # long boxed answers from being retained wholesale
                 prediction_files.append(
                     (
-                        json_file.name,
-                        final_answer[:100] + "..."
-                        if len(final_answer) > 100
+                        name,
+                        final_answer[:60] + "..."
+                        if len(final_answer) > 60
                         else final_answer,
                     )
                 )
-            else:
-                results["without_predictions"] += 1
+        else:
+            c.without_predictions += 1
 
-            # Count by error presence
-            if error_msg and error_msg.strip():
-                results["with_errors"] += 1
-                error_files.append((json_file.name, error_msg))
+        # Count by error presence
+        if error_msg and error_msg.strip():
+            c.with_errors += 1
+            if len(error_files) < MAX_EXAMPLE_FILES:
+                error_files.append((name, error_msg))
 
-        except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
-            results["parse_errors"] += 1
-            parse_error_files.append((json_file.name, str(e)))
-            print(f"Error parsing {json_file.name}: {e}")
+    results = {
+        "total_files": c.total_files,
+        "completed_status": status_counts["completed"],
+        "running_status": status_counts["running"],
+        "failed_status": status_counts["failed"],
+        "with_predictions": c.with_predictions,
+        "without_predictions": c.without_predictions,
+        "with_errors": c.with_errors,
+        "parse_errors": c.parse_errors,
+    }
 
     return (
         results,
@@ -168,30 +254,30 @@ def display_results(
         print("\nFirst 5 completed files:")
         for i, filename in enumerate(completed_files[:5], 1):
             print(f"  {i}. {filename}")
-        if len(completed_files) > 5:
-            print(f"  ... and {len(completed_files) - 5} more")
+        if completed > 5:
+            print(f"  ... and {completed - 5} more")
 
     if running_files:
         print("\nFirst 5 running files:")
         for i, filename in enumerate(running_files[:5], 1):
             print(f"  {i}. {filename}")
-        if len(running_files) > 5:
-            print(f"  ... and {len(running_files) - 5} more")
+        if running > 5:
+            print(f"  ... and {running - 5} more")
 
     if prediction_files:
         print("\nFirst 5 files with predictions:")
         for i, (filename, prediction) in enumerate(prediction_files[:5], 1):
             print(f"  {i}. {filename}")
             print(f"     Prediction: {prediction}")
-        if len(prediction_files) > 5:
-            print(f"  ... and {len(prediction_files) - 5} more")
+        if with_predictions > 5:
+            print(f"  ... and {with_predictions - 5} more")
 
     if error_files:
         print("\nFiles with errors:")
         for filename, error in error_files[:5]:
             print(f"  - {filename}: {error[:100]}...")
-        if len(error_files) > 5:
-            print(f"  ... and {len(error_files) - 5} more")
+        if with_errors > 5:
+            print(f"  ... and {with_errors - 5} more")
 
     if parse_error_files:
         print("\nFiles with parse errors:")
@@ -13,11 +13,70 @@ Usage:
 If no path is provided, uses the default folder.
 """
 
-import json
+import os
+import re
 import sys
-from pathlib import Path
 from typing import Dict, List, Tuple
 
+from _common import (
+    MAX_EXAMPLE_FILES,
+    Counters,
+    classify_parallel,
+    iter_task_jsons,
+    json_loads as _json_loads,
+)
+
+# Byte-level patterns for the few shallow string fields we actually read.
+# Plain-string values only ([^"\\]*); anything fancier falls back to a full
+# JSON parse, so multi-MB trace logs are usually never fully decoded.
+_STATUS_RE = re.compile(rb'"status"\s*:\s*"([^"\\]*)"')
+_JUDGE_RESULT_RE = re.compile(rb'"judge_result"\s*:\s*"([^"\\]*)"')
+
+
+def classify_file(info: Tuple[str, str]) -> Tuple[str, str, str]:
+    """
+    Parse and classify a single task log.
+
+    Args:
+        info: (path, name) of the task JSON file
+
+    Returns:
+        (name, status, judge_result); status is None on parse failure and the
+        error message is returned in the judge_result slot
+
+    Non-completed files return early with an empty judge_result: the analyzer
+    never reads it for them, so their judge field is not even extracted.
+    """
+    path, name = info
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        data = None
+        m = _STATUS_RE.search(raw)
+        if m is not None:
+            status = m.group(1).decode("utf-8")
+        else:
+            data = _json_loads(raw)
+            status = data.get("status", "")
+
+        # The pipeline emits canonical casing (lowercase status, uppercase
+        # judge grades), so no per-file re-normalization is needed
+        if status != "completed":
+            return (name, status, "")
+
+        m = _JUDGE_RESULT_RE.search(raw)
+        if m is not None:
+            judge_result = m.group(1).decode("utf-8")
+        else:
+            if data is None:
+                data = _json_loads(raw)
+            judge_result = data.get("judge_result", "")
+    except (ValueError, KeyError, FileNotFoundError) as e:
+        return (name, None, str(e))
+
+    return (name, status, judge_result)
+
 
 def analyze_gaia_results(log_folder: str) -> Dict[str, int]:
     """
@@ -29,55 +88,60 @@ def analyze_gaia_results(log_folder: str) -> Dict[str, int]:
     Returns:
         Dictionary with counts of different categories
     """
-    log_path = Path(log_folder)
-
-    if not log_path.exists():
+    # Plain-string paths throughout: os.DirEntry already carries both the
+    # display name and the open()-able path, so no Path objects are needed
+    if not os.path.exists(log_folder):
         raise FileNotFoundError(f"Log folder not found: {log_folder}")
 
     # Find all task JSON files
-    json_files = list(log_path.glob("task_*_attempt_*.json"))
-
-    results = {
-        "total_files": 0,
-        "completed_status": 0,
-        "completed_and_correct": 0,
-        "completed_and_incorrect": 0,
-        "other_status": 0,
-        "parse_errors": 0,
-    }
+    json_files = list(iter_task_jsons(log_folder))
 
     completed_correct_files = []
     completed_incorrect_files = []
     parse_error_files = []
 
-    print(f"Scanning {len(json_files)} files in {log_folder}...")
-
-    for json_file in json_files:
-        results["total_files"] += 1
+    # Slotted Counters attributes in the hot loop; the results dict is
+    # assembled once at the end instead of being re-indexed per file.
+    c = Counters()
 
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            status = data.get("status", "").lower()
-            judge_result = data.get("judge_result", "").upper()
-
-            if status == "completed":
-                results["completed_status"] += 1
+    print(f"Scanning {len(json_files)} files in {log_folder}...")
 
-                if judge_result == "CORRECT":
-                    results["completed_and_correct"] += 1
-                    completed_correct_files.append(json_file.name)
-                else:
-                    results["completed_and_incorrect"] += 1
-                    completed_incorrect_files.append((json_file.name, judge_result))
-            else:
-                results["other_status"] += 1
+    for name, status, judge_result in classify_parallel(classify_file, json_files):
+        # Filenames may land in several example lists; interning shares storage
+        name = sys.intern(name)
+        c.total_files += 1
+
+        if status is None:
+            # judge_result carries the parse error message in this case
+            c.parse_errors += 1
+            parse_error_files.append((name, judge_result))
+            print(f"Error parsing {name}: {judge_result}")
+            continue
+
+        # Non-completed files need no further inspection
+        if status != "completed":
+            c.other_status += 1
+            continue
+
+        c.completed_status += 1
+
+        if judge_result == "CORRECT":
+            c.completed_and_correct += 1
+            if len(completed_correct_files) < MAX_EXAMPLE_FILES:
+                completed_correct_files.append(name)
+        else:
+            c.completed_and_incorrect += 1
+            if len(completed_incorrect_files) < MAX_EXAMPLE_FILES:
+                completed_incorrect_files.append((name, judge_result))
 
-        except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
-            results["parse_errors"] += 1
-            parse_error_files.append((json_file.name, str(e)))
-            print(f"Error parsing {json_file.name}: {e}")
+    results = {
+        "total_files": c.total_files,
+        "completed_status": c.completed_status,
+        "completed_and_correct": c.completed_and_correct,
+        "completed_and_incorrect": c.completed_and_incorrect,
+        "other_status": c.other_status,
+        "parse_errors": c.parse_errors,
+    }
 
     return (
         results,
@@ -130,15 +194,15 @@ def display_results(
         print("\nFirst 5 correct files:")
         for i, filename in enumerate(correct_files[:5], 1):
             print(f"  {i}. {filename}")
-        if len(correct_files) > 5:
-            print(f"  ... and {len(correct_files) - 5} more")
+        if correct > 5:
+            print(f"  ... and {correct - 5} more")
 
     if incorrect_files:
         print("\nFirst 5 incorrect files (with judge results):")
         for i, (filename, judge_result) in enumerate(incorrect_files[:5], 1):
             print(f"  {i}. {filename} -> {judge_result}")
-        if len(incorrect_files) > 5:
-            print(f"  ... and {len(incorrect_files) - 5} more")
+        if incorrect > 5:
+            print(f"  ... and {incorrect - 5} more")
 
     if error_files:
         print("\nFiles with parse errors:")
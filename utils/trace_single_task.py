@@ -4,7 +4,6 @@
 
 import asyncio
 import logging
-import pathlib
 from pathlib import Path
 import dotenv
 import hydra
@@ -33,8 +32,9 @@ async def single_task(
     )
 
     task_name = task_id
-    log_path = pathlib.Path(".") / pathlib.Path(cfg.output_dir) / f"{task_name}.log"
-    logger.info(f"logger_path is {log_path.absolute()}")
+    # Resolve once; .absolute() re-reads the CWD on every call
+    log_path = (Path.cwd() / logs_dir / f"{task_name}.log").resolve()
+    logger.info(f"logger_path is {log_path}")
 
     # Execute task using the pipeline
     final_summary, final_boxed_answer, _ = await execute_task_pipeline(
@@ -46,8 +46,8 @@ async def single_task(
         main_agent_tool_manager=main_agent_tool_manager,
         sub_agent_tool_managers=sub_agent_tool_managers,
         output_formatter=output_formatter,
-        # relative to the folder where shell command is launched.
-        log_path=log_path.absolute(),
+        # already resolved against the folder where shell command is launched.
+        log_path=log_path,
     )
 
     # Print task result
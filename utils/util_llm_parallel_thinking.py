@@ -20,6 +20,15 @@ from eval_utils import verify_answer_for_datasets
 from dotenv import load_dotenv
 from argparse import ArgumentParser
 
+try:
+    # orjson parses the multi-MB attempt logs and serializes the results
+    # several times faster than stdlib json; optional.
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 load_dotenv()
 
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
@@ -86,8 +95,8 @@ def extract_from_log(
         for log_file in log_files:
             try:
                 task_id = log_file.split("/")[-1].split("_")[1]
-                with open(log_file, "r") as f:
-                    data = json.load(f)
+                with open(log_file, "rb") as f:
+                    data = _json_loads(f.read())
                     if task_id not in task_score_dict:
                         task_score_dict[task_id] = []
                     task_score_dict[task_id].append(
@@ -103,7 +112,7 @@ def extract_from_log(
                             ),
                         }
                     )
-            except (json.JSONDecodeError, KeyError, IOError) as e:
+            except (ValueError, KeyError, IOError) as e:
                 print(f"Warning: Could not process log file {log_file}: {e}")
                 continue
     except Exception as e:
@@ -149,7 +158,7 @@ async def select_best_solution(
             raise ValueError("Empty response from API")
 
         # Parse the structured response
-        parsed_response = json.loads(response)
+        parsed_response = _json_loads(response)
 
         # Get usage information
         usage = completion.usage
@@ -544,8 +553,12 @@ def save_results(
         results_file = os.path.join(
             results_dir, f"llm_parallel_thinking_{n_runs}runs.json"
         )
-        with open(results_file, "w") as f:
-            json.dump(task_results, f, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            with open(results_file, "wb") as f:
+                f.write(orjson.dumps(task_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(results_file, "w") as f:
+                json.dump(task_results, f, ensure_ascii=False, indent=4)
 
         # Calculate and save accuracy
         correct_count = sum(
@@ -4,12 +4,16 @@
 
 
 import asyncio
-import glob
+import hashlib
 import json
 import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple, Literal
 
+import httpx
 from openai import AsyncOpenAI
 from openai import APIError, APIConnectionError, RateLimitError, APITimeoutError
 from pydantic import BaseModel
@@ -19,6 +23,15 @@ from tenacity.asyncio import AsyncRetrying
 from eval_utils import verify_answer_for_datasets
 from dotenv import load_dotenv
 
+try:
+    # orjson parses the multi-MB attempt logs and serializes the results
+    # several times faster than stdlib json; optional.
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 load_dotenv()
 
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
@@ -30,6 +43,17 @@ class ExtractedAnswer(BaseModel):
     strict: Literal[True] = True  # 100% reliability
 
 
+class BatchedAnswer(BaseModel):
+    task_id: str
+    reasoning: str
+    final_answer: str
+
+
+class BatchedAnswers(BaseModel):
+    results: List[BatchedAnswer]
+    strict: Literal[True] = True  # 100% reliability
+
+
 # Constants
 BENCHMARK_NAME = "gaia-validation"  # Benchmark name for evaluation
 RESULTS_DIRS = ["<your_results_dirs>"]
@@ -42,6 +66,101 @@ RETRY_WAIT_MAX = 10  # seconds
 MAX_CONCURRENT_REQUESTS = 25  # Maximum concurrent API requests
 SEMAPHORE_TIMEOUT = 300  # Timeout for acquiring semaphore in seconds
 VERBOSE = True
+BATCH_SIZE = 10  # Tasks grouped into one selection API call; 1 disables batching
+MAX_BATCH_PROMPT_CHARS = 200_000  # Oversized batches fall back to single calls
+
+# One shared AsyncOpenAI client for every call: constructing a client per
+# request would rebuild the TLS context and connection pool each time,
+# defeating HTTP keep-alive. Built lazily so importing the module costs
+# nothing; retries stay with tenacity (max_retries=0 disables the SDK's own).
+_CLIENT: Optional[AsyncOpenAI] = None
+
+
+def _get_client() -> AsyncOpenAI:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = AsyncOpenAI(
+            base_url=OPENAI_BASE_URL,
+            api_key=OPENAI_API_KEY,
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONCURRENT_REQUESTS * 2,
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                )
+            ),
+        )
+    return _CLIENT
+
+
+async def _close_client() -> None:
+    """Close the shared client; call once after the event loop's work is done."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.close()
+        _CLIENT = None
+
+
+class LLMCache:
+    """Deterministic on-disk cache for LLM selection responses.
+
+    Responses are keyed by a hash of the selection payload (model, question,
+    sorted candidate answers), so re-runs and overlapping result directories
+    reuse earlier selections instead of re-issuing identical API calls. Each
+    entry is its own JSON file, which keeps concurrent writers safe without
+    locking.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None on a miss."""
+        try:
+            with open(self._path(key), "rb") as f:
+                return _json_loads(f.read())
+        except (IOError, ValueError):
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Persist a response atomically (write-then-rename)."""
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(
+                    orjson.dumps(value)
+                    if orjson is not None
+                    else json.dumps(value, ensure_ascii=False).encode("utf-8")
+                )
+            os.replace(tmp_path, path)
+        except IOError as e:
+            print(f"Warning: Could not write cache entry {key}: {e}")
+
+
+def selection_cache_key(model: str, question: str, answers: List[str]) -> str:
+    """Hash the selection payload for cache lookup.
+
+    Only the model, question and sorted candidate answers go into the key —
+    not the rendered prompt — so prompt-template edits do not invalidate
+    cached selections.
+    """
+    # stdlib json on purpose: the key bytes must not depend on whether
+    # orjson is installed, or caches would not survive environment changes
+    payload = json.dumps(
+        {"m": model, "q": question, "a": sorted(answers)}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Per-key locks serializing concurrent tasks that share a selection payload:
+# the first task through makes the API call and fills the cache, the rest hit
+# the entry it wrote instead of issuing duplicate calls
+_key_locks: Dict[str, asyncio.Lock] = {}
 
 
 def process_message_history(main_agent_message_history: Dict[str, Any]) -> str:
@@ -69,38 +188,30 @@ def process_message_history(main_agent_message_history: Dict[str, Any]) -> str:
         return ""
 
 
-def extract_from_log(
-    run_dir: str, task_score_dict: Dict[str, List[Dict[str, Any]]]
-) -> None:
-    """Extract task data from log files in a run directory."""
+def _parse_one_log(log_file: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Parse one attempt log into (task_id, entry); the thread-pool unit."""
     try:
-        log_files = glob.glob(os.path.join(run_dir, "*attempt*"))
-        for log_file in log_files:
-            try:
-                task_id = log_file.split("/")[-1].split("_")[1]
-                with open(log_file, "r") as f:
-                    data = json.load(f)
-                    if task_id not in task_score_dict:
-                        task_score_dict[task_id] = []
-                    task_score_dict[task_id].append(
-                        # select some keys from data
-                        {
-                            "task_id": data["task_id"],
-                            "task_name": data["task_original_name"],
-                            "ground_truth": data["ground_truth"],
-                            "final_boxed_answer": data["final_boxed_answer"],
-                            "input": data["input"],
-                            "agent_summary": process_message_history(
-                                data["main_agent_message_history"]
-                            ),
-                        }
-                    )
-            except (json.JSONDecodeError, KeyError, IOError) as e:
-                print(f"Warning: Could not process log file {log_file}: {e}")
-                continue
-    except Exception as e:
-        print(f"Error processing run directory {run_dir}: {e}")
-        raise
+        task_id = log_file.split("/")[-1].split("_")[1]
+        with open(log_file, "rb") as f:
+            data = _json_loads(f.read())
+        # select some keys from data
+        entry = {
+            "task_id": data["task_id"],
+            "task_name": data["task_original_name"],
+            "ground_truth": data["ground_truth"],
+            "final_boxed_answer": data["final_boxed_answer"],
+            "input": data["input"],
+            "agent_summary": process_message_history(
+                data["main_agent_message_history"]
+            ),
+        }
+        # The parsed tree is mostly unused message history; drop it before
+        # returning so peak memory stays one log deep per worker
+        del data
+        return task_id, entry
+    except (ValueError, KeyError, IOError) as e:
+        print(f"Warning: Could not process log file {log_file}: {e}")
+        return None
 
 
 async def select_best_solution(
@@ -108,6 +219,7 @@ async def select_best_solution(
     n_runs: int,
     model: str = DEFAULT_MODEL,
     semaphore: Optional[asyncio.Semaphore] = None,
+    response_model: type = ExtractedAnswer,
 ) -> str:
     """Select the best solution using LLM with retry logic and concurrency control."""
 
@@ -118,12 +230,12 @@ async def select_best_solution(
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
 
-        client = AsyncOpenAI(
-            base_url=OPENAI_BASE_URL,
-            api_key=api_key,
-        )
+        client = _get_client()
 
-        completion = await client.beta.chat.completions.parse(
+        # Plain JSON mode instead of the beta structured-output endpoint:
+        # the prompts already spell out the expected JSON shape, and this
+        # skips the client-side schema build and validation on every call.
+        completion = await client.chat.completions.create(
             model=model,
             messages=[
                 {
@@ -133,15 +245,17 @@ async def select_best_solution(
                     ],
                 }
             ],
-            response_format=ExtractedAnswer,
+            response_format={"type": "json_object"},
         )
 
         response = completion.choices[0].message.content
         if not response:
             raise ValueError("Empty response from API")
 
-        # Parse the structured response
-        parsed_response = json.loads(response)
+        parsed_response = _json_loads(response)
+        if VERBOSE:
+            # Surface malformed responses early; skipped on the hot path.
+            response_model.model_validate(parsed_response)
         return parsed_response
 
     # Use semaphore for concurrency control if provided
@@ -178,64 +292,73 @@ async def _retry_api_call(api_call_func):
                 raise
 
 
-def load_task_data(results_dir: str) -> Dict[str, List[Dict[str, Any]]]:
-    """Load task data from all run directories."""
-    run_dirs = glob.glob(os.path.join(results_dir, "run_*"))
-    run_dirs = [d for d in run_dirs if os.path.isdir(d)]
+def load_task_data(
+    results_dir: str,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], int]:
+    """Load task data from all run directories; returns (task data, run count)."""
+    # scandir instead of glob: DirEntry caches is_dir()/is_file(), so the
+    # listing needs no per-entry stat or fnmatch pass, and the run count is
+    # a by-product rather than a second directory walk for the callers
+    run_dirs = [
+        e.path
+        for e in os.scandir(results_dir)
+        if e.is_dir() and e.name.startswith("run_")
+    ]
 
-    task_score_dict: Dict[str, List[Dict[str, Any]]] = {}
+    log_files: List[str] = []
     for run_dir in run_dirs:
-        extract_from_log(run_dir, task_score_dict)
+        log_files.extend(
+            e.path for e in os.scandir(run_dir) if e.is_file() and "attempt" in e.name
+        )
+
+    task_score_dict: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    if not log_files:
+        return task_score_dict, len(run_dirs)
+
+    # File reads and the orjson parse release the GIL, so a thread pool loads
+    # the logs in parallel; merging the small entries back into the dict on
+    # the main thread is cheap by comparison
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(log_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for parsed in pool.map(_parse_one_log, log_files):
+            if parsed is None:
+                continue
+            task_id, entry = parsed
+            task_score_dict[task_id].append(entry)
 
-    return task_score_dict
+    return task_score_dict, len(run_dirs)
 
 
 def load_combined_task_data(
     results_dirs: List[str],
 ) -> Tuple[Dict[str, List[Dict[str, Any]]], int]:
     """Load and combine task data from multiple result directories."""
-    combined_dict: Dict[str, List[Dict[str, Any]]] = {}
+    combined_dict: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     total_runs = 0
 
     for results_dir in results_dirs:
         if not os.path.exists(results_dir):
             print(f"Warning: Skipping non-existent directory: {results_dir}")
             continue
-        task_data = load_task_data(results_dir)
-        run_count = len(
-            [
-                d
-                for d in os.listdir(results_dir)
-                if os.path.isdir(os.path.join(results_dir, d)) and d.startswith("run_")
-            ]
-        )
+        task_data, run_count = load_task_data(results_dir)
         total_runs += run_count
 
         for task_id, data_list in task_data.items():
-            if task_id not in combined_dict:
-                combined_dict[task_id] = []
             combined_dict[task_id].extend(data_list)
 
     return combined_dict, total_runs
 
 
-def create_selection_gaia_prompt(task_data: List[Dict[str, Any]], n_runs: int) -> str:
-    """Create prompt for solution selection."""
-    #     prompt = f"""You are an expert evaluator. Your task is to analyze multiple answers to a question and determine the final answer based on majority vote.
-
-    # Question:
-    # {task_data[0]["input"]}
-
-    # Refer to the following {n_runs} solutions and select the best solution. Make sure the answer is in `\\boxed{{}}`.
-    #     """
-    # answers_text = ";".join([d["final_boxed_answer"] for d in task_data])
-    answers_text = [f"{d['final_boxed_answer']}" for d in task_data]
-    prompt = f"""You are an expert evaluator working with me to determine the best answer from multiple responses. I need your help to identify which answers are equivalent and then select the most frequently occurring one.
+# Built once at import; create_selection_gaia_prompt only fills in the
+# question and answer list instead of re-assembling this text per task.
+_SELECTION_GAIA_TEMPLATE = """You are an expert evaluator working with me to determine the best answer from multiple responses. I need your help to identify which answers are equivalent and then select the most frequently occurring one.
 
-Question: {task_data[0]["input"]}
+Question: {question}
 
 Multiple Answers:
-{answers_text}
+{answers}
+
+Each entry above is {{"answer": ..., "count": N}}: answers that were already identical after basic normalization have been merged, and count says how many runs produced that answer. Weigh each answer by its count when determining the majority.
 
 Here's how we can approach this together:
 
@@ -276,26 +399,143 @@ Please respond in JSON format:
     "final_answer": "Your selected answer (exactly as it appears in the original list)"
 }}
 """
-    #     for i, d in enumerate(task_data):
-    #         prompt += f"""
-    # {'-'*100}
-    # Solution {i+1}:
-    # {d["main_agent_message_history"]["message_history"][-2]["content"]}
-    # {d["main_agent_message_history"]["message_history"][-1]["content"][0]["text"]}
-    # """
+
+
+def _normalize_numeric(s: str) -> Optional[float]:
+    """Normalize a numeric answer per the prompt rules; None if not numeric."""
+    try:
+        return float(s.replace("$", "").replace("%", "").replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def _normalize_text(s: str) -> str:
+    """Normalize a text answer per the prompt rules."""
+    return re.sub(r"[\W_]+", "", s).lower()
+
+
+def _canonical_answer(s: str) -> str:
+    """Canonical form of an answer, mirroring the prompt's equivalence rules."""
+    num = _normalize_numeric(s)
+    if num is not None:
+        return f"num:{num}"
+    return f"txt:{_normalize_text(s)}"
+
+
+def _group_answers(
+    answers: List[str],
+) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """Group answers by canonical form before involving the LLM.
+
+    Returns (majority, grouped): majority is a representative answer when one
+    group holds a strict majority — those tasks need no API call at all.
+    Otherwise majority is None and grouped holds one representative per group
+    with its occurrence count, giving the LLM a deduped, shorter prompt that
+    still carries the frequency information.
+    """
+    groups: Dict[str, List[str]] = {}
+    for ans in answers:
+        groups.setdefault(_canonical_answer(ans), []).append(ans)
+
+    # "No answer" responses never win the vote (the prompt ignores them too)
+    candidates = {
+        k: v for k, v in groups.items() if k not in ("txt:none", "txt:notfound")
+    }
+    if candidates:
+        best = max(candidates.values(), key=len)
+        if len(best) * 2 > len(answers):
+            return best[0], []
+
+    grouped = [
+        {"answer": members[0], "count": len(members)} for members in groups.values()
+    ]
+    return None, grouped
+
+
+def create_selection_gaia_prompt(
+    question: str, answers: List[Dict[str, Any]], n_runs: int
+) -> str:
+    """Create prompt for solution selection from grouped answer entries."""
+    return _SELECTION_GAIA_TEMPLATE.format(question=question, answers=answers)
+
+
+def create_batched_selection_prompt(
+    batch: List[Tuple[str, str, List[Dict[str, Any]]]],
+) -> str:
+    """Create one prompt covering the selection decisions for several tasks.
+
+    Each batch entry is a (task_id, question, grouped answers) triple.
+    """
+    sections = []
+    for i, (task_id, question, answers) in enumerate(batch, 1):
+        sections.append(
+            f"### Task {i} (task_id: {task_id})\n"
+            f"Question: {question}\n\n"
+            f"Multiple Answers:\n{answers}"
+        )
+    tasks_text = "\n\n".join(sections)
+
+    prompt = f"""You are an expert evaluator working with me to determine the best answer from multiple responses. Below are {len(batch)} independent tasks; for each one I need your help to identify which answers are equivalent and then select the most frequently occurring one.
+
+{tasks_text}
+
+Each answer entry is {{"answer": ..., "count": N}}: answers that were already identical after basic normalization have been merged, and count says how many runs produced that answer. Weigh each answer by its count when determining the majority.
+
+Here's how we can approach each task:
+
+**Understanding Equivalence:**
+I'd like you to group answers that are equivalent according to these precise normalization rules:
+
+For numerical answers:
+   - Remove symbols "$", "%", and "," then convert to float numbers and compare
+   - Examples: "1.5" equals "1.50", "$1,000" equals "1000", "50%" equals "50"
+   - Must be exactly equal as float numbers after normalization
+
+For text answers (single text, not lists):
+   - Remove all spaces and punctuation, convert to lowercase, then compare
+   - Examples: "sea gull" equals "seagull", "New York!" equals "newyork"
+   - Note: "NYC" ≠ "New York City" (becomes "nyc" vs "newyorkcity" - different words)
+
+For list answers (containing commas or semicolons):
+   - Split into elements, lists must have same length
+   - Compare elements in the same position
+   - For each element: if it's a number, use number rules; if text, remove spaces only (keep punctuation), convert to lowercase
+   - All corresponding elements must match
+   - [Rule]: Questions shouldn't require pure numerical lists with >10 elements. If you see long numerical lists, the question likely expects a single number (e.g., sum, conversion). Interpret based on question intent and convert list to a single number before comparing equivalence.
+
+**Important:** Valid answers always exist for these questions. Ignore responses containing "none", "not found", or similar expressions indicating no answer exists.
+
+**Your Task:**
+Treat every task independently. For each one:
+1. Group the answers that you determine are equivalent
+2. Identify which group appears most frequently
+3. Select the clearest representative answer from the winning group
+4. Choose only from the original answers provided for that task
+
+I trust your judgment in applying these guidelines sensibly, especially for any edge cases that might arise.
+
+Please respond in JSON format with one entry per task, keyed by the exact task_id shown above:
+{{
+    "results": [
+        {{
+            "task_id": "The task_id exactly as given",
+            "reasoning": "Your analysis of how you grouped the answers and determined the majority",
+            "final_answer": "Your selected answer (exactly as it appears in that task's original list)"
+        }}
+    ]
+}}
+"""
     return prompt
 
 
-async def process_single_task(
-    task_id: str, data: List[Dict[str, Any]], n_runs: int, semaphore: asyncio.Semaphore
+async def _build_task_result(
+    task_id: str,
+    data: List[Dict[str, Any]],
+    answers: List[str],
+    prompt: str,
+    response: Dict[str, Any],
 ) -> Tuple[str, Dict[str, Any]]:
-    """Process a single task and return its result."""
-    if "gaia" in BENCHMARK_NAME:
-        prompt = create_selection_gaia_prompt(data, n_runs)
-    else:
-        raise ValueError(f"Unsupported benchmark name: {BENCHMARK_NAME}")
-
-    response = await select_best_solution(prompt, n_runs, semaphore=semaphore)
+    """Verify a selection response and assemble the per-task result record."""
     selected_solution = response["final_answer"]
     reasoning = response["reasoning"]
     result = await verify_answer_for_datasets(
@@ -304,7 +544,7 @@ async def process_single_task(
 
     task_result = {
         "task_id": task_id,
-        "candidate_answers": [d["final_boxed_answer"] for d in data],
+        "candidate_answers": answers,
         "task_input": data[0]["input"],
         "prompt_input": prompt,
         "ground_truth": data[0]["ground_truth"],
@@ -316,55 +556,269 @@ async def process_single_task(
     return task_id, task_result
 
 
+async def process_single_task(
+    task_id: str,
+    data: List[Dict[str, Any]],
+    n_runs: int,
+    cache: Optional[LLMCache] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Process a single task and return its result."""
+    answers = [d["final_boxed_answer"] for d in data]
+    majority, grouped = _group_answers(answers)
+    if majority is not None:
+        # A strict majority agrees after normalization; no LLM needed
+        response = {
+            "final_answer": majority,
+            "reasoning": "Resolved deterministically: a strict majority of answers share one normalized form.",
+        }
+        return await _build_task_result(
+            task_id, data, answers, "(no prompt sent)", response
+        )
+
+    if "gaia" in BENCHMARK_NAME:
+        prompt = create_selection_gaia_prompt(data[0]["input"], grouped, n_runs)
+    else:
+        raise ValueError(f"Unsupported benchmark name: {BENCHMARK_NAME}")
+
+    if cache is not None:
+        key = selection_cache_key(DEFAULT_MODEL, data[0]["input"], answers)
+        # Tasks sharing a payload serialize on the key so only the first one
+        # pays for the API call; the rest read the entry it cached
+        async with _key_locks.setdefault(key, asyncio.Lock()):
+            response = cache.get(key)
+            if response is None:
+                response = await select_best_solution(prompt, n_runs)
+                cache.set(key, response)
+    else:
+        response = await select_best_solution(prompt, n_runs)
+
+    return await _build_task_result(task_id, data, answers, prompt, response)
+
+
+async def process_task_batch(
+    batch: List[Tuple[str, List[Dict[str, Any]]]],
+    n_runs: int,
+    cache: Optional[LLMCache] = None,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Process a batch of tasks with a single selection API call.
+
+    Cache hits are resolved up front without touching the API; the remaining
+    tasks share one batched call. Tasks the model omits from the returned
+    array — and batches whose prompt grows past MAX_BATCH_PROMPT_CHARS — fall
+    back to the single-task path.
+    """
+    results: List[Tuple[str, Dict[str, Any]]] = []
+    pending: List[Tuple[str, List[Dict[str, Any]], List[str], Any, Optional[str]]] = []
+
+    for task_id, data in batch:
+        # Materialized once and reused for the cache key, the prompts and
+        # the candidate_answers field of the result record
+        answers = [d["final_boxed_answer"] for d in data]
+        majority, grouped = _group_answers(answers)
+        if majority is not None:
+            response = {
+                "final_answer": majority,
+                "reasoning": "Resolved deterministically: a strict majority of answers share one normalized form.",
+            }
+            results.append(
+                await _build_task_result(
+                    task_id, data, answers, "(no prompt sent)", response
+                )
+            )
+            continue
+        key = None
+        if cache is not None:
+            key = selection_cache_key(DEFAULT_MODEL, data[0]["input"], answers)
+            cached = cache.get(key)
+            if cached is not None:
+                results.append(
+                    await _build_task_result(
+                        task_id,
+                        data,
+                        answers,
+                        create_selection_gaia_prompt(data[0]["input"], grouped, n_runs),
+                        cached,
+                    )
+                )
+                continue
+        pending.append((task_id, data, answers, grouped, key))
+
+    if not pending:
+        return results
+    if len(pending) == 1:
+        task_id, data, _, _, _ = pending[0]
+        results.append(await process_single_task(task_id, data, n_runs, cache=cache))
+        return results
+
+    prompt = create_batched_selection_prompt(
+        [(tid, d[0]["input"], grouped) for tid, d, _, grouped, _ in pending]
+    )
+    if len(prompt) > MAX_BATCH_PROMPT_CHARS:
+        for task_id, data, _, _, _ in pending:
+            results.append(
+                await process_single_task(task_id, data, n_runs, cache=cache)
+            )
+        return results
+
+    response = await select_best_solution(prompt, n_runs, response_model=BatchedAnswers)
+    by_task = {str(r.get("task_id", "")): r for r in response.get("results", [])}
+
+    for task_id, data, answers, _, key in pending:
+        answer = by_task.get(task_id)
+        if not answer or "final_answer" not in answer:
+            # The model skipped this task in the array; retry it alone
+            results.append(
+                await process_single_task(task_id, data, n_runs, cache=cache)
+            )
+            continue
+        response_entry = {
+            "final_answer": answer["final_answer"],
+            "reasoning": answer.get("reasoning", ""),
+        }
+        if cache is not None and key is not None:
+            cache.set(key, response_entry)
+        results.append(
+            await _build_task_result(task_id, data, answers, prompt, response_entry)
+        )
+
+    return results
+
+
 async def process_tasks(
     task_score_dict: Dict[str, List[Dict[str, Any]]],
     n_runs: int,
     max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+    cache_dir: Optional[str] = None,
+    output_dir: Optional[str] = None,
 ) -> Dict[str, Dict[str, Any]]:
-    """Process all tasks concurrently and select best solutions."""
-    # Create semaphore for rate limiting
-    semaphore = asyncio.Semaphore(max_concurrent_requests)
+    """Process all tasks concurrently and select best solutions.
+
+    When output_dir is given, every finished task is appended to a
+    llm_majority_voter_{n_runs}runs.jsonl journal in that directory, and
+    tasks already present in the journal are skipped on the next run, so
+    an interrupted voting session resumes where it stopped.
+    """
+    # Selection responses are cached on disk when a cache directory is given
+    cache = LLMCache(cache_dir) if cache_dir else None
 
-    # Create tasks for concurrent execution
-    tasks = [
-        process_single_task(task_id, data, n_runs, semaphore)
+    task_results: Dict[str, Dict[str, Any]] = {}
+    journal_path = None
+    if output_dir is not None:
+        journal_path = os.path.join(
+            output_dir, f"llm_majority_voter_{n_runs}runs.jsonl"
+        )
+        if os.path.exists(journal_path):
+            with open(journal_path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = _json_loads(line)
+                    except ValueError:
+                        continue  # truncated trailing line from a crash
+                    task_results[str(record.get("task_id", ""))] = record
+            if task_results:
+                print(
+                    f"Resuming: {len(task_results)} tasks already completed in {journal_path}"
+                )
+    already_done = len(task_results)
+
+    # Feed batches of (task_id, data) pairs through a queue drained by a
+    # fixed pool of workers. Concurrency is bounded by the worker count, so
+    # no semaphore is needed, and prompts are built just-in-time inside the
+    # workers — only O(workers) prompt strings are alive at once. Batching
+    # folds up to BATCH_SIZE selection decisions into one API round-trip.
+    items = [
+        (task_id, data)
         for task_id, data in task_score_dict.items()
+        if task_id not in task_results
     ]
+    batch_size = max(1, BATCH_SIZE)
+    queue: asyncio.Queue = asyncio.Queue()
+    for start in range(0, len(items), batch_size):
+        queue.put_nowait(items[start : start + batch_size])
 
-    total_tasks = len(tasks)
+    total_tasks = len(items)
     print(
-        f"Processing {total_tasks} tasks concurrently (max {max_concurrent_requests} concurrent requests)..."
+        f"Processing {total_tasks} tasks concurrently (max {max_concurrent_requests} concurrent requests, batches of {batch_size})..."
     )
 
     # Process tasks and show progress as they complete
-    task_results: Dict[str, Dict[str, Any]] = {}
+    journal = open(journal_path, "ab") if journal_path is not None else None
     completed_tasks = 0
+    failed_tasks = 0
+    # Circuit breaker: once enough tasks have finished and most of them
+    # failed, stop pulling new work instead of burning retries on every
+    # remaining task (typically a dead endpoint or exhausted quota).
+    abort = asyncio.Event()
+
+    async def _worker() -> None:
+        nonlocal completed_tasks, failed_tasks
+        while not abort.is_set():
+            try:
+                batch = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                if len(batch) == 1:
+                    task_id, data = batch[0]
+                    pairs = [
+                        await process_single_task(task_id, data, n_runs, cache=cache)
+                    ]
+                else:
+                    pairs = await process_task_batch(batch, n_runs, cache=cache)
+
+                for task_id, task_result in pairs:
+                    task_results[task_id] = task_result
+                    if journal is not None:
+                        # One line per finished task, flushed immediately so
+                        # a crash loses at most the in-flight batch
+                        if orjson is not None:
+                            journal.write(orjson.dumps(task_result) + b"\n")
+                        else:
+                            journal.write(
+                                (json.dumps(task_result, ensure_ascii=False) + "\n").encode("utf-8")
+                            )
+                        journal.flush()
+                    completed_tasks += 1
+
+                    # Show progress indicator
+                    progress_percent = (completed_tasks / total_tasks) * 100
+                    if VERBOSE:
+                        print(
+                            f"Progress: {completed_tasks}/{total_tasks} ({progress_percent:.1f}%) - Completed task: {task_id}"
+                        )
 
-    for coro in asyncio.as_completed(tasks):
-        try:
-            result = await coro
-            task_id, task_result = result
-            task_results[task_id] = task_result
-            completed_tasks += 1
-
-            # Show progress indicator
-            progress_percent = (completed_tasks / total_tasks) * 100
-            if VERBOSE:
-                print(
-                    f"Progress: {completed_tasks}/{total_tasks} ({progress_percent:.1f}%) - Completed task: {task_id}"
-                )
+            except Exception as e:
+                completed_tasks += len(batch)
+                failed_tasks += len(batch)
+                progress_percent = (completed_tasks / total_tasks) * 100
+                if VERBOSE:
+                    print(
+                        f"Progress: {completed_tasks}/{total_tasks} ({progress_percent:.1f}%) - Error processing batch: {e}"
+                    )
+                if completed_tasks > 20 and failed_tasks / completed_tasks > 0.5:
+                    if not abort.is_set():
+                        abort.set()
+                        print(
+                            f"Circuit breaker tripped: {failed_tasks}/{completed_tasks} tasks failed; aborting the remaining work"
+                        )
+                # Continue with other batches instead of failing completely
+                continue
 
-        except Exception as e:
-            completed_tasks += 1
-            progress_percent = (completed_tasks / total_tasks) * 100
-            if VERBOSE:
-                print(
-                    f"Progress: {completed_tasks}/{total_tasks} ({progress_percent:.1f}%) - Error processing task: {e}"
-                )
-            # Continue with other tasks instead of failing completely
-            continue
+    n_workers = min(max_concurrent_requests, queue.qsize())
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(n_workers):
+                tg.create_task(_worker())
+    finally:
+        if journal is not None:
+            journal.close()
 
-    print(f"Successfully processed {len(task_results)} out of {total_tasks} tasks")
+    print(
+        f"Successfully processed {len(task_results) - already_done} out of {total_tasks} tasks"
+    )
     return task_results
 
 
@@ -377,8 +831,12 @@ def save_results(
         results_file = os.path.join(
             results_dir, f"llm_majority_voter_{n_runs}runs.json"
         )
-        with open(results_file, "w") as f:
-            json.dump(task_results, f, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            with open(results_file, "wb") as f:
+                f.write(orjson.dumps(task_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(results_file, "w") as f:
+                json.dump(task_results, f, ensure_ascii=False, indent=4)
 
         # Calculate and save accuracy
         correct_count = sum(
@@ -411,18 +869,23 @@ async def main(
 
     print(f"Analyzing results from: {results_dir}")
 
-    # Load task data from all runs
-    task_score_dict = load_task_data(results_dir)
+    # Load task data from all runs; the run count comes with it
+    task_score_dict, n_runs = load_task_data(results_dir)
     if not task_score_dict:
         print("No task data found")
         return
 
-    # Get number of runs
-    run_dirs = glob.glob(os.path.join(results_dir, "run_*"))
-    n_runs = len([d for d in run_dirs if os.path.isdir(d)])
-
     # Process all tasks
-    task_results = await process_tasks(task_score_dict, n_runs, max_concurrent_requests)
+    try:
+        task_results = await process_tasks(
+            task_score_dict,
+            n_runs,
+            max_concurrent_requests,
+            cache_dir=os.path.join(results_dir, ".voter_cache"),
+            output_dir=results_dir,
+        )
+    finally:
+        await _close_client()
 
     # Save results
     save_results(results_dir, task_results, n_runs)
@@ -445,10 +908,18 @@ if __name__ == "__main__":
         )
 
         async def main_combined():
-            task_results = await process_tasks(
-                combined_dict, total_runs, max_concurrent_requests
-            )
-            save_results(os.path.dirname(results_dirs[0]), task_results, total_runs)
+            output_dir = os.path.dirname(results_dirs[0])
+            try:
+                task_results = await process_tasks(
+                    combined_dict,
+                    total_runs,
+                    max_concurrent_requests,
+                    cache_dir=os.path.join(output_dir, ".voter_cache"),
+                    output_dir=output_dir,
+                )
+            finally:
+                await _close_client()
+            save_results(output_dir, task_results, total_runs)
 
         asyncio.run(main_combined())
     else:
@@ -3,56 +3,59 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+from collections import Counter
 from pathlib import Path
 
 
-def analyze_json_files(folder_path):
+def iter_results(folder, error_files):
     """
-    Analyze judge_result and task_file_name statistics in JSON files
-    """
-    folder = Path(folder_path)
-
-    # Initialize counters
-    total_correct = 0
-    total_incorrect = 0
-    null_task_file_correct = 0
-    null_task_file_incorrect = 0
-
-    # Store processed file information
-    processed_files = 0
-    error_files = []
-
-    print(f"Starting to analyze folder: {folder_path}")
-    print("=" * 60)
+    Yield (judge_result, task_file_is_null) for each JSON file in the folder.
 
-    # Iterate through all JSON files in the folder
+    Files that fail to parse are recorded in error_files instead of yielded.
+    """
     for json_file in folder.glob("*.json"):
         try:
-            processed_files += 1
-            print(f"Processing file {processed_files}: {json_file.name}")
-
             with open(json_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
-
-            # Count judge_result
-            if "judge_result" in data:
-                if data["judge_result"] == "CORRECT":
-                    total_correct += 1
-                elif data["judge_result"] == "INCORRECT":
-                    total_incorrect += 1
-
-                # Check if task_file_name under input is null
-                if "input" in data and isinstance(data["input"], dict):
-                    if data["input"].get("task_file_name") is None:
-                        if data["judge_result"] == "CORRECT":
-                            null_task_file_correct += 1
-                        elif data["judge_result"] == "INCORRECT":
-                            null_task_file_incorrect += 1
-
         except json.JSONDecodeError as e:
             error_files.append(f"{json_file.name}: JSON parsing error - {e}")
+            continue
         except Exception as e:
             error_files.append(f"{json_file.name}: Other error - {e}")
+            continue
+
+        # Check if task_file_name under input is null
+        task_file_is_null = (
+            isinstance(data.get("input"), dict)
+            and data["input"].get("task_file_name") is None
+        )
+        yield data.get("judge_result"), task_file_is_null
+
+
+def analyze_json_files(folder_paths: list[str] | str):
+    """
+    Analyze judge_result and task_file_name statistics in JSON files
+    across one or more result folders
+    """
+    if isinstance(folder_paths, (str, Path)):
+        folder_paths = [folder_paths]
+
+    error_files = []
+    counts = Counter()
+
+    # Single pass per folder: count each (judge_result, task_file_is_null)
+    # combination
+    for folder_path in folder_paths:
+        print(f"Starting to analyze folder: {folder_path}")
+        print("=" * 60)
+        counts.update(iter_results(Path(folder_path), error_files))
+
+    processed_files = counts.total() + len(error_files)
+
+    total_correct = counts[("CORRECT", True)] + counts[("CORRECT", False)]
+    total_incorrect = counts[("INCORRECT", True)] + counts[("INCORRECT", False)]
+    null_task_file_correct = counts[("CORRECT", True)]
+    null_task_file_incorrect = counts[("INCORRECT", True)]
 
     # Output statistics results
     print("\n" + "=" * 60)